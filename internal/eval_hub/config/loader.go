@@ -66,20 +66,13 @@ func readConfig(logger *slog.Logger, name string, ext string, dirs ...string) (*
 		logger.Error("Failed to unmarshal environment variable mappings", "error", err.Error())
 		return nil, err
 	}
-	if len(envMappings.EnvMappings) > 0 {
-		for envName, field := range envMappings.EnvMappings {
-			if err := configValues.BindEnv(field, strings.ToUpper(envName)); err != nil {
-				logger.Error("Failed to bind environment variable", "field_name", field, "env_name", envName, "error", err.Error())
-				return nil, err
-			}
-			logger.Info("Mapped environment variable", "field_name", field, "env_name", envName)
-		}
-		// now we need to reload the config file
-		err = configValues.ReadInConfig()
-		if err != nil {
-			logger.Error("Failed to reload the configuration file", "error", err.Error())
+	// env bindings are resolved lazily on Get, so the config file does not need to be re-read
+	for envName, field := range envMappings.EnvMappings {
+		if err := configValues.BindEnv(field, strings.ToUpper(envName)); err != nil {
+			logger.Error("Failed to bind environment variable", "field_name", field, "env_name", envName, "error", err.Error())
 			return nil, err
 		}
+		logger.Info("Mapped environment variable", "field_name", field, "env_name", envName)
 	}
 
 	return configValues, err
@@ -225,86 +218,67 @@ func hasExplicitConfigDir(dirs []string) bool {
 }
 
 func LoadProviderConfigs(logger *slog.Logger, validate *validator.Validate, dirs ...string) (map[string]api.ProviderResource, error) {
-	if !hasExplicitConfigDir(dirs) {
-		dirs = []string{}
-		for _, dir := range configLookup {
-			dirs = append(dirs, dir+"/providers")
-		}
-	} else {
-		dirs = []string{dirs[0] + "/providers"}
-	}
-
-	providerConfigs := make(map[string]api.ProviderResource)
-
-	files, dir, err := scanFolders(logger, dirs...)
-	if err != nil {
-		return providerConfigs, err
-	}
-	for _, file := range files {
-		if file.IsDir() || !strings.HasSuffix(file.Name(), ".yaml") {
-			continue
-		}
-		name := strings.TrimSuffix(file.Name(), ".yaml")
-		providerConfig, fileUsed, err := loadProvider(logger, validate, name, dir)
-		if err != nil {
-			return nil, err
-		}
-
-		fileName := fileUsed
-		if fileName == "" {
-			fileName = file.Name()
-		}
-		if providerConfig.Resource.ID == "" {
-			logger.Warn("Provider config missing id, skipping", "file", fileName)
-			continue
-		}
-
-		providerConfigs[providerConfig.Resource.ID] = *providerConfig
-		logger.Info("Provider loaded", "provider_id", providerConfig.Resource.ID, "file", fileName)
-	}
-
-	return providerConfigs, nil
+	return loadResourceConfigs(logger, validate, "providers", "Provider", "provider_id", loadProvider,
+		func(p *api.ProviderResource) string { return p.Resource.ID }, dirs...)
 }
 
 func LoadCollectionConfigs(logger *slog.Logger, validate *validator.Validate, dirs ...string) (map[string]api.CollectionResource, error) {
+	return loadResourceConfigs(logger, validate, "collections", "Collection", "collection_id", loadCollection,
+		func(c *api.CollectionResource) string { return c.Resource.ID }, dirs...)
+}
+
+// loadResourceConfigs loads every YAML file in the subDir of the first config directory
+// that contains any, keyed by the ID returned by id. Files without an ID are skipped.
+func loadResourceConfigs[T any](
+	logger *slog.Logger,
+	validate *validator.Validate,
+	subDir string,
+	kind string,
+	idKey string,
+	load func(*slog.Logger, *validator.Validate, string, ...string) (*T, string, error),
+	id func(*T) string,
+	dirs ...string,
+) (map[string]T, error) {
 	if !hasExplicitConfigDir(dirs) {
 		dirs = []string{}
 		for _, dir := range configLookup {
-			dirs = append(dirs, dir+"/collections")
+			dirs = append(dirs, dir+"/"+subDir)
 		}
 	} else {
-		dirs = []string{dirs[0] + "/collections"}
+		dirs = []string{dirs[0] + "/" + subDir}
 	}
 
-	collectionConfigs := make(map[string]api.CollectionResource)
+	configs := make(map[string]T)
 
 	files, dir, err := scanFolders(logger, dirs...)
 	if err != nil {
-		return collectionConfigs, err
+		return configs, err
 	}
 	for _, file := range files {
-		if file.IsDir() || !strings.HasSuffix(file.Name(), ".yaml") {
+		name, isYAML := strings.CutSuffix(file.Name(), ".yaml")
+		if file.IsDir() || !isYAML {
 			continue
 		}
-		name := strings.TrimSuffix(file.Name(), ".yaml")
-		collectionConfig, fileUsed, err := loadCollection(logger, validate, name, dir)
+		resource, fileUsed, err := load(logger, validate, name, dir)
 		if err != nil {
 			return nil, err
 		}
+
 		fileName := fileUsed
 		if fileName == "" {
 			fileName = file.Name()
 		}
-		if collectionConfig.Resource.ID == "" {
-			logger.Warn("Collection config missing id, skipping", "file", fileName)
+		resourceID := id(resource)
+		if resourceID == "" {
+			logger.Warn(kind+" config missing id, skipping", "file", fileName)
 			continue
 		}
 
-		collectionConfigs[collectionConfig.Resource.ID] = *collectionConfig
-		logger.Info("Collection loaded", "collection_id", collectionConfig.Resource.ID, "file", fileName)
+		configs[resourceID] = *resource
+		logger.Info(kind+" loaded", idKey, resourceID, "file", fileName)
 	}
 
-	return collectionConfigs, nil
+	return configs, nil
 }
 
 // LoadConfig loads configuration using a two-tier system with Viper. This implements
@@ -385,10 +359,7 @@ func LoadConfig(logger *slog.Logger, version string, build string, buildDate str
 		if _, err := os.Stat(secrets.Dir); !os.IsNotExist(err) {
 			for fileName, fieldName := range secrets.Mappings {
 				// the secret file name can be optional by appending :optional to the file name
-				optional := strings.HasSuffix(fileName, ":optional")
-				if optional {
-					fileName = strings.TrimSuffix(fileName, ":optional")
-				}
+				fileName, optional := strings.CutSuffix(fileName, ":optional")
 				secret, err := getSecret(secrets.Dir, fileName, optional)
 				if err != nil {
 					// log the error and fail the startup (by returning the error)
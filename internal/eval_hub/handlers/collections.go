@@ -45,6 +45,9 @@ var (
 		{Path: "/pass_criteria", Op: api.PatchOpRemove, Prefix: false},
 		{Path: "/pass_criteria", Op: api.PatchOpReplace, Prefix: false},
 	}
+
+	// these are the query parameters accepted when listing collections
+	allowedCollectionListParams = []string{"limit", "offset", "name", "category", "tags", "owner", "scope"}
 )
 
 // entireBenchmarkPatchPath matches JSON Patch paths that replace or add the full benchmarks array (/benchmarks)
@@ -74,11 +77,10 @@ func (h *Handlers) HandleListCollections(ctx *executioncontext.ExecutionContext,
 				return err
 			}
 
-			allowedParams := []string{"limit", "offset", "name", "category", "tags", "owner", "scope"}
-			badParams := getAllParams(req, allowedParams...)
+			badParams := getAllParams(req, allowedCollectionListParams...)
 			if len(badParams) > 0 {
 				// just report the first bad parameter
-				return serviceerrors.NewServiceError(messages.QueryBadParameter, "ParameterName", badParams[0], "AllowedParameters", strings.Join(allowedParams, ", "))
+				return serviceerrors.NewServiceError(messages.QueryBadParameter, "ParameterName", badParams[0], "AllowedParameters", strings.Join(allowedCollectionListParams, ", "))
 			}
 
 			ofilter = filter
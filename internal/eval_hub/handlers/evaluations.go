@@ -25,6 +25,9 @@ import (
 	"github.com/go-playground/validator/v10"
 )
 
+// these are the query parameters accepted when listing evaluation jobs
+var allowedEvaluationListParams = []string{"limit", "offset", "status", "name", "tags", "owner", "experiment_id"}
+
 // BackendSpec represents the backend specification
 type BackendSpec struct {
 	URL  string `json:"url"`
@@ -401,11 +404,10 @@ func (h *Handlers) HandleListEvaluations(ctx *executioncontext.ExecutionContext,
 
 			logging.LogRequestStarted(ctx, "filter", filter)
 
-			allowedParams := []string{"limit", "offset", "status", "name", "tags", "owner", "experiment_id"}
-			badParams := getAllParams(req, allowedParams...)
+			badParams := getAllParams(req, allowedEvaluationListParams...)
 			if len(badParams) > 0 {
 				// just report the first bad parameter
-				return serviceerrors.NewServiceError(messages.QueryBadParameter, "ParameterName", badParams[0], "AllowedParameters", strings.Join(allowedParams, ", "))
+				return serviceerrors.NewServiceError(messages.QueryBadParameter, "ParameterName", badParams[0], "AllowedParameters", strings.Join(allowedEvaluationListParams, ", "))
 			}
 
 			status, err := GetParam(req, "status", true, "")
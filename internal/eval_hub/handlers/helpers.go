@@ -103,11 +103,16 @@ func GetParam[T string | int | bool](r http_wrappers.RequestWrapper, name string
 	}
 }
 
+// mismatchedScopeParams are the query parameters that can not be used together
+var mismatchedScopeParams = []string{"owner", "scope"}
+
+// allowedScopeValues lists the accepted values of the scope query parameter
+const allowedScopeValues = abstractions.ScopeSystem + "|" + abstractions.ScopeTenant
+
 func CheckScope(filter *abstractions.QueryFilter) error {
 	// owner and scope are mutually exclusive
-	mismatchedParams := []string{"owner", "scope"}
-	if filter.HasParams(mismatchedParams...) {
-		return serviceerrors.NewServiceError(messages.QueryParameterMismatch, "ParameterNames", strings.Join(mismatchedParams, ","))
+	if filter.HasParams(mismatchedScopeParams...) {
+		return serviceerrors.NewServiceError(messages.QueryParameterMismatch, "ParameterNames", strings.Join(mismatchedScopeParams, ","))
 	}
 
 	// scope matches to other fields in the filter
@@ -118,7 +123,7 @@ func CheckScope(filter *abstractions.QueryFilter) error {
 		case abstractions.ScopeSystem, abstractions.ScopeTenant:
 			return nil
 		default:
-			return serviceerrors.NewServiceError(messages.QueryParameterValueInvalid, "ParameterName", "scope", "AllowedValues", strings.Join([]string{abstractions.ScopeSystem, abstractions.ScopeTenant}, "|"))
+			return serviceerrors.NewServiceError(messages.QueryParameterValueInvalid, "ParameterName", "scope", "AllowedValues", allowedScopeValues)
 		}
 	}
 
@@ -181,15 +186,20 @@ func CommonListFilters(r http_wrappers.RequestWrapper, extraParams ...string) (*
 	}, nil
 }
 
+// getAllParams returns the query parameters of the request that are not in allowedParams.
 func getAllParams(r http_wrappers.RequestWrapper, allowedParams ...string) []string {
 	uri, err := url.Parse(r.URI())
 	if err != nil {
-		return []string{}
+		return nil
+	}
+	// only the disallowed parameters are collected, so no result slice is built when every parameter is allowed
+	var params []string
+	for param := range uri.Query() {
+		if !slices.Contains(allowedParams, param) {
+			params = append(params, param)
+		}
 	}
-	params := slices.Collect(maps.Keys(uri.Query()))
-	return slices.DeleteFunc(params, func(p string) bool {
-		return slices.Contains(allowedParams, p)
-	})
+	return params
 }
 
 // isAllowedPatch returns true if the JSON Patch path targets a valid field.
@@ -243,7 +253,7 @@ func GetJobBenchmarks(job *api.EvaluationJobResource, collection *api.Collection
 				"CollectionID", job.Collection.ID,
 			)
 		}
-		var mergedBenchmarks []api.EvaluationBenchmarkConfig
+		mergedBenchmarks := make([]api.EvaluationBenchmarkConfig, 0, len(collection.Benchmarks))
 		for _, benchmark := range collection.Benchmarks {
 			benchmark := mergeBenchmarkParameters(benchmark, job.Collection.Benchmarks)
 			mergedBenchmarks = append(mergedBenchmarks, benchmark)
@@ -260,10 +270,22 @@ func GetJobBenchmarks(job *api.EvaluationJobResource, collection *api.Collection
 }
 
 func mergeBenchmarkParameters(benchmark api.CollectionBenchmarkConfig, jobBenchmarks []api.EvaluationBenchmarkConfig) api.EvaluationBenchmarkConfig {
+	// a single pass over the job benchmarks collects the provider parameters, the first
+	// exact (id + provider) override and the first provider-level hardware config
 	parameters := map[string]any{}
-	for _, jobBenchmark := range jobBenchmarks {
-		if jobBenchmark.ProviderID == benchmark.ProviderID {
-			maps.Copy(parameters, jobBenchmark.Parameters)
+	var override *api.EvaluationBenchmarkConfig
+	var providerHardwareConfig *api.BenchmarkHardwareConfig
+	for i := range jobBenchmarks {
+		jobBenchmark := &jobBenchmarks[i]
+		if jobBenchmark.ProviderID != benchmark.ProviderID {
+			continue
+		}
+		maps.Copy(parameters, jobBenchmark.Parameters)
+		if override == nil && jobBenchmark.ID == benchmark.ID {
+			override = jobBenchmark
+		}
+		if providerHardwareConfig == nil && jobBenchmark.ID == "" && jobBenchmark.HardwareConfig != nil {
+			providerHardwareConfig = jobBenchmark.HardwareConfig
 		}
 	}
 	for key, value := range benchmark.Parameters {
@@ -276,25 +298,14 @@ func mergeBenchmarkParameters(benchmark api.CollectionBenchmarkConfig, jobBenchm
 	// pick up TestDataRef and HardwareConfig from the job override if provided
 	testDataRef := benchmark.TestDataRef
 	var hardwareConfig *api.BenchmarkHardwareConfig
-
-	for _, jobBenchmark := range jobBenchmarks {
-		if jobBenchmark.ID == benchmark.ID && jobBenchmark.ProviderID == benchmark.ProviderID {
-			if jobBenchmark.TestDataRef != nil {
-				testDataRef = jobBenchmark.TestDataRef
-			}
-			if jobBenchmark.HardwareConfig != nil {
-				hardwareConfig = jobBenchmark.HardwareConfig
-			}
-			break
+	if override != nil {
+		if override.TestDataRef != nil {
+			testDataRef = override.TestDataRef
 		}
+		hardwareConfig = override.HardwareConfig
 	}
 	if hardwareConfig == nil {
-		for _, jobBenchmark := range jobBenchmarks {
-			if jobBenchmark.ProviderID == benchmark.ProviderID && jobBenchmark.ID == "" && jobBenchmark.HardwareConfig != nil {
-				hardwareConfig = jobBenchmark.HardwareConfig
-				break
-			}
-		}
+		hardwareConfig = providerHardwareConfig
 	}
 	return api.EvaluationBenchmarkConfig{
 		Ref:            benchmark.Ref,
@@ -177,6 +177,34 @@ func TestMergeBenchmarkParameters(t *testing.T) {
 			t.Fatalf("Parameters = %#v, want %#v", got.Parameters, want)
 		}
 	})
+
+	t.Run("benchmark override hardware_config wins over earlier provider-level entry", func(t *testing.T) {
+		t.Parallel()
+		benchmark := api.CollectionBenchmarkConfig{
+			Ref:        api.Ref{ID: "bench-1"},
+			ProviderID: "prov-a",
+		}
+		testDataRef := &api.TestDataRef{}
+		job := []api.EvaluationBenchmarkConfig{
+			{
+				ProviderID:     "prov-a",
+				HardwareConfig: &api.BenchmarkHardwareConfig{HardwareProfileName: "shared-profile"},
+			},
+			{
+				Ref:            api.Ref{ID: "bench-1"},
+				ProviderID:     "prov-a",
+				HardwareConfig: &api.BenchmarkHardwareConfig{HardwareProfileName: "bench-profile"},
+				TestDataRef:    testDataRef,
+			},
+		}
+		got := mergeBenchmarkParameters(benchmark, job)
+		if got.HardwareConfig == nil || got.HardwareConfig.HardwareProfileName != "bench-profile" {
+			t.Fatalf("hardware_config = %+v, want bench-profile", got.HardwareConfig)
+		}
+		if got.TestDataRef != testDataRef {
+			t.Fatalf("test_data_ref = %+v, want the benchmark override", got.TestDataRef)
+		}
+	})
 }
 
 func TestGetJobBenchmarks(t *testing.T) {
@@ -49,6 +49,9 @@ var (
 		{Path: "/agent", Op: api.PatchOpRemove, Prefix: true},
 		{Path: "/agent", Op: api.PatchOpReplace, Prefix: true},
 	}
+
+	// these are the query parameters accepted when listing providers
+	allowedProviderListParams = []string{"limit", "offset", "benchmarks", "name", "tags", "owner", "scope"}
 )
 
 func (h *Handlers) HandleCreateProvider(ctx *executioncontext.ExecutionContext, req http_wrappers.RequestWrapper, w http_wrappers.ResponseWrapper) {
@@ -131,11 +134,10 @@ func (h *Handlers) HandleListProviders(ctx *executioncontext.ExecutionContext, r
 				return err
 			}
 
-			allowedParams := []string{"limit", "offset", "benchmarks", "name", "tags", "owner", "scope"}
-			badParams := getAllParams(req, allowedParams...)
+			badParams := getAllParams(req, allowedProviderListParams...)
 			if len(badParams) > 0 {
 				// just report the first bad parameter
-				return serviceerrors.NewServiceError(messages.QueryBadParameter, "ParameterName", badParams[0], "AllowedParameters", strings.Join(allowedParams, ", "))
+				return serviceerrors.NewServiceError(messages.QueryBadParameter, "ParameterName", badParams[0], "AllowedParameters", strings.Join(allowedProviderListParams, ", "))
 			}
 
 			// remove the benchmarks if requested
@@ -2,12 +2,23 @@ package handlers_test
 
 import (
 	"context"
+	"encoding/json"
 	"fmt"
+	"io"
 	"log/slog"
+	"net/http/httptest"
+	"slices"
+	"strings"
+	"testing"
 
 	"github.com/eval-hub/eval-hub/internal/eval_hub/abstractions"
+	"github.com/eval-hub/eval-hub/internal/eval_hub/constants"
+	"github.com/eval-hub/eval-hub/internal/eval_hub/executioncontext"
+	"github.com/eval-hub/eval-hub/internal/eval_hub/handlers"
 	"github.com/eval-hub/eval-hub/internal/eval_hub/messages"
 	"github.com/eval-hub/eval-hub/internal/eval_hub/serviceerrors"
+	"github.com/eval-hub/eval-hub/internal/logging"
+	"github.com/eval-hub/eval-hub/internal/testhelpers"
 	"github.com/eval-hub/eval-hub/pkg/api"
 )
 
@@ -163,7 +174,7 @@ func TestHandleListProviders_ReturnsSystemProviders(t *testing.T) {
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	var storage abstractions.Storage = &fakeStorage{providerConfigs: providerConfigs}
 	storage = storage.WithTenant(api.Tenant("test-tenant"))
-	h := handlers.New(storage, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(storage, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -213,7 +224,7 @@ func TestHandleListProviders_AppliesPaginationWhenLimitLessThanSystemProviders(t
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -247,6 +258,54 @@ func TestHandleListProviders_AppliesPaginationWhenLimitLessThanSystemProviders(t
 	}
 }
 
+func TestHandleListProviders_RejectsUnknownQueryParameter(t *testing.T) {
+	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
+	h := handlers.New(&fakeStorage{providerConfigs: map[string]api.ProviderResource{}}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
+
+	tests := []struct {
+		name        string
+		uri         string
+		queryValues map[string][]string
+		wantCode    int
+		wantInBody  string
+	}{
+		{
+			name:        "unknown parameter is rejected by name",
+			uri:         "/api/v1/evaluations/providers?limit=5&bogus=1",
+			queryValues: map[string][]string{"limit": {"5"}, "bogus": {"1"}},
+			wantCode:    400,
+			wantInBody:  "'bogus' is not a valid query parameter",
+		},
+		{
+			name:        "allowed parameters only are accepted",
+			uri:         "/api/v1/evaluations/providers?limit=5&benchmarks=false",
+			queryValues: map[string][]string{"limit": {"5"}, "benchmarks": {"false"}},
+			wantCode:    200,
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := &providersRequest{
+				MockRequest: createMockRequest("GET", tt.uri),
+				queryValues: tt.queryValues,
+				pathValues:  map[string]string{},
+			}
+			recorder := httptest.NewRecorder()
+			resp := MockResponseWrapper{recorder: recorder}
+			ctx := executioncontext.NewExecutionContext(context.Background(), "req-1", logger, "test-user", "test-tenant")
+
+			h.HandleListProviders(ctx, req, resp)
+
+			if recorder.Code != tt.wantCode {
+				t.Fatalf("expected status %d, got %d body %s", tt.wantCode, recorder.Code, recorder.Body.String())
+			}
+			if tt.wantInBody != "" && !strings.Contains(recorder.Body.String(), tt.wantInBody) {
+				t.Errorf("expected body to contain %q, got %s", tt.wantInBody, recorder.Body.String())
+			}
+		})
+	}
+}
+
 func TestHandleListProviders_FilterSystemProvidersWithCommaAndPipe(t *testing.T) {
 	providerConfigs := map[string]api.ProviderResource{
 		"p1": {
@@ -263,7 +322,7 @@ func TestHandleListProviders_FilterSystemProvidersWithCommaAndPipe(t *testing.T)
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	tests := []struct {
 		name            string
@@ -350,7 +409,7 @@ func TestHandleListProviders_ExcludesSystemProvidersWhenParamFalse(t *testing.T)
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -389,7 +448,7 @@ func TestHandleListProviders_ExcludesBenchmarksWhenParamFalse(t *testing.T) {
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -428,7 +487,7 @@ func TestHandleListProviders_ReturnsUserProvidersFromStorage(t *testing.T) {
 		providers:   []api.ProviderResource{userProvider},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(storage, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(storage, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -468,7 +527,7 @@ func TestHandleListProviders_ReturnsErrorWhenStorageFails(t *testing.T) {
 		err:         fmt.Errorf("storage unavailable"),
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(storage, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(storage, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -488,7 +547,7 @@ func TestHandleListProviders_ReturnsErrorWhenStorageFails(t *testing.T) {
 
 func TestHandleListProviders_Returns400WhenInvalidLimit(t *testing.T) {
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers"),
@@ -518,7 +577,7 @@ func TestHandleListProvidersReturnsEmptyForInvalidProviderID(t *testing.T) {
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	req := &providersRequest{
 		MockRequest: createMockRequest("GET", "/api/v1/evaluations/providers/unknown"),
@@ -553,7 +612,7 @@ func TestHandleUpdateProvider(t *testing.T) {
 	}
 	// providerConfigs empty so getSystemProvider returns nil
 	logger := logging.FallbackLogger() // slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(storage, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(storage, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	body := `{"name":"Updated Name","description":"Updated desc","benchmarks":[]}`
 	req := &providersRequest{
@@ -591,7 +650,7 @@ func TestHandleUpdateProviderRejectsSystemProvider(t *testing.T) {
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	body := `{"name":"Hacked","description":"","benchmarks":[]}`
 	req := &providersRequest{
@@ -625,7 +684,7 @@ func TestHandlePatchProvider(t *testing.T) {
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(storage, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(storage, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	body := `[{"op":"replace","path":"/description","value":"Patched description"}]`
 	req := &providersRequest{
@@ -664,7 +723,7 @@ func TestHandlePatchProviderRejectsImmutablePaths(t *testing.T) {
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(storage, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(storage, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	immutablePaths := []string{"/resource", "/resource/id", "/resource/tenant", "/created_at", "/updated_at"}
 	for _, path := range immutablePaths {
@@ -695,7 +754,7 @@ func TestHandlePatchProviderRejectsSystemProvider(t *testing.T) {
 		},
 	}
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
-	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, validation.NewValidator(), &fakeRuntime{}, nil, nil, nil)
+	h := handlers.New(&fakeStorage{providerConfigs: providerConfigs}, testhelpers.NewValidator(t), &fakeRuntime{}, nil, nil, nil)
 
 	body := `[{"op":"replace","path":"/name","value":"Hacked"}]`
 	req := &providersRequest{
@@ -716,7 +775,7 @@ func TestHandlePatchProviderRejectsSystemProvider(t *testing.T) {
 
 func TestHandleCreateProvider(t *testing.T) {
 	storage := &fakeStorage{}
-	validate := validation.NewValidator()
+	validate := testhelpers.NewValidator(t)
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	h := handlers.New(storage, validate, &fakeRuntime{}, nil, nil, nil)
 
@@ -750,7 +809,7 @@ func TestHandleCreateProvider(t *testing.T) {
 
 func TestHandleDeleteProvider(t *testing.T) {
 	storage := &fakeStorage{}
-	validate := validation.NewValidator()
+	validate := testhelpers.NewValidator(t)
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	h := handlers.New(storage, validate, &fakeRuntime{}, nil, nil, nil)
 
@@ -771,7 +830,7 @@ func TestHandleDeleteProvider(t *testing.T) {
 
 func TestHandleDeleteProvider_MissingPathParam(t *testing.T) {
 	storage := &fakeStorage{}
-	validate := validation.NewValidator()
+	validate := testhelpers.NewValidator(t)
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	h := handlers.New(storage, validate, &fakeRuntime{}, nil, nil, nil)
 
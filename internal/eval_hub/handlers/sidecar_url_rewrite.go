@@ -5,9 +5,9 @@ import (
 	"log/slog"
 	"os"
 	"strings"
-	"sync"
 
 	"github.com/eval-hub/eval-hub/internal/eval_hub/config"
+	"github.com/eval-hub/eval-hub/internal/platform"
 	"github.com/eval-hub/eval-hub/pkg/api"
 )
 
@@ -15,12 +15,6 @@ const (
 	evalHubInstanceNameEnv   = "EVALHUB_INSTANCE_NAME"
 	defaultEvalHubPort       = "8443"
 	defaultSidecarListenPort = 8080
-	inClusterNamespaceFile   = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
-)
-
-var (
-	inClusterNamespaceOnce sync.Once
-	inClusterNamespace     string
 )
 
 // rewriteSidecarURLsInBenchmarkStatus replaces sidecar localhost URLs in status
@@ -87,7 +81,7 @@ func evalHubServiceURL(tenantNamespace string) string {
 	if instanceName == "" {
 		return ""
 	}
-	saNamespace := readInClusterNamespace()
+	saNamespace := platform.InClusterNamespace()
 	if saNamespace == "" {
 		saNamespace = strings.TrimSpace(tenantNamespace)
 	}
@@ -97,17 +91,6 @@ func evalHubServiceURL(tenantNamespace string) string {
 	return fmt.Sprintf("https://%s.%s.svc.cluster.local:%s", instanceName, saNamespace, defaultEvalHubPort)
 }
 
-func readInClusterNamespace() string {
-	inClusterNamespaceOnce.Do(func() {
-		content, err := os.ReadFile(inClusterNamespaceFile)
-		if err != nil {
-			return
-		}
-		inClusterNamespace = strings.TrimSpace(string(content))
-	})
-	return inClusterNamespace
-}
-
 func normalizeRegistryURL(host string) string {
 	host = strings.TrimSpace(host)
 	if host == "" {
@@ -272,6 +272,7 @@ type MessageCode struct {
 	status int
 	one    string
 	code   string
+	tmpl   *template.Template // parsed once from one, nil if the template is invalid
 }
 
 func (m *MessageCode) GetStatusCode() int {
@@ -287,16 +288,23 @@ func (m *MessageCode) GetMessage() string {
 }
 
 func createMessage(status int, one string, code string) *MessageCode {
+	// parse the template once here rather than every time an error message is rendered,
+	// the messages are literals so an invalid template is a programming error
+	tmpl := template.Must(template.New(code).Parse(one))
 	return &MessageCode{
 		status,
 		one,
 		code,
+		tmpl,
 	}
 }
 
 func GetErrorMessage(messageCode *MessageCode, messageParams ...any) string {
-	msg := messageCode.GetMessage()
-	params := make(map[string]any)
+	// a nil map renders exactly like an empty one, so only allocate when there are parameters
+	var params map[string]any
+	if len(messageParams) > 0 {
+		params = make(map[string]any, (len(messageParams)+1)/2)
+	}
 	for i := 0; i < len(messageParams); i += 2 {
 		param := messageParams[i]
 		var paramValue any
@@ -308,9 +316,8 @@ func GetErrorMessage(messageCode *MessageCode, messageParams ...any) string {
 		params[param.(string)] = paramValue
 	}
 
-	tmpl, _ := template.New("errmfs").Parse(msg)
 	out := bytes.NewBuffer(nil)
-	err := tmpl.Execute(out, params)
+	err := messageCode.tmpl.Execute(out, params)
 	if err != nil {
 		return "INVALID TEMPLATE"
 	}
@@ -0,0 +1,40 @@
+package messages
+
+import (
+	"testing"
+
+	"github.com/eval-hub/eval-hub/internal/eval_hub/constants"
+)
+
+func TestGetErrorMessage(t *testing.T) {
+	msg := GetErrorMessage(ResourceNotFound, "Type", "provider", "ResourceId", "p1")
+	want := "The provider resource 'p1' was not found."
+	if msg != want {
+		t.Errorf("GetErrorMessage() = %q, want %q", msg, want)
+	}
+}
+
+func TestGetErrorMessage_MissingParamValue(t *testing.T) {
+	msg := GetErrorMessage(MissingPathParameter, "ParameterName")
+	want := "The path parameter 'NOT_DEFINED' is required."
+	if msg != want {
+		t.Errorf("GetErrorMessage() = %q, want %q", msg, want)
+	}
+}
+
+func TestGetErrorMessage_NoParams(t *testing.T) {
+	msg := GetErrorMessage(MissingPathParameter)
+	want := "The path parameter '<no value>' is required."
+	if msg != want {
+		t.Errorf("GetErrorMessage() = %q, want %q", msg, want)
+	}
+}
+
+func TestCreateMessage_InvalidTemplatePanics(t *testing.T) {
+	defer func() {
+		if recover() == nil {
+			t.Error("createMessage() should panic for an invalid template")
+		}
+	}()
+	createMessage(constants.HTTPCodeBadRequest, "The value {{.Value", "invalid_template")
+}
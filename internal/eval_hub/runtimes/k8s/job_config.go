@@ -8,6 +8,7 @@ import (
 
 	"github.com/eval-hub/eval-hub/internal/eval_hub/config"
 	"github.com/eval-hub/eval-hub/internal/eval_hub/runtimes/shared"
+	"github.com/eval-hub/eval-hub/internal/platform"
 	"github.com/eval-hub/eval-hub/pkg/api"
 	"github.com/google/uuid"
 	corev1 "k8s.io/api/core/v1"
@@ -27,7 +28,6 @@ const (
 	defaultNamespace            = "default"
 	evalHubInstanceNameEnv      = "EVALHUB_INSTANCE_NAME"
 	mlflowTrackingURIEnv        = "MLFLOW_TRACKING_URI"
-	inClusterNamespaceFile      = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
 	serviceAccountNameSuffix    = "-job"
 	serviceCAConfigMapSuffix    = "-service-ca"
 	defaultTestDataInitCmd      = "/app/eval-runtime-init"
@@ -149,11 +149,10 @@ func buildJobConfig(evaluation *api.EvaluationJobResource, provider *api.Provide
 	// Build ServiceAccount name and ConfigMap name if instance name is set.
 	// The SA name uses the instance namespace (not the tenant namespace) to match
 	// the operator's naming convention: <instance>-<instance-namespace>-job.
-	instanceNamespace := readInClusterNamespace()
 	var serviceAccountName, serviceCAConfigMap, evalHubURL string
 	var evalHubCRNamespace string
 	if evalHubInstanceName != "" {
-		saNamespace := instanceNamespace
+		saNamespace := platform.InClusterNamespace()
 		if saNamespace == "" {
 			saNamespace = namespace // fallback when not running in-cluster
 		}
@@ -162,7 +161,7 @@ func buildJobConfig(evaluation *api.EvaluationJobResource, provider *api.Provide
 		serviceCAConfigMap = evalHubInstanceName + serviceCAConfigMapSuffix
 		// EvalHub URL points to the kube-rbac-proxy HTTPS endpoint in the instance namespace.
 		// Use saNamespace (which falls back to namespace when not in-cluster) to avoid a malformed host
-		// when instanceNamespace is empty.
+		// when the in-cluster namespace is unavailable.
 		// This is required by sidecar to call eval-hub API.
 		// This is different from job_spec.callback_url which is used by the adapter to call the sidecar
 		evalHubURL = fmt.Sprintf("https://%s.%s.svc.cluster.local:%s",
@@ -465,21 +464,12 @@ func resolveNamespace(configured string) string {
 	if configured != "" {
 		return configured
 	}
-	inClusterNamespace := readInClusterNamespace()
-	if inClusterNamespace != "" {
-		return inClusterNamespace
+	if namespace := platform.InClusterNamespace(); namespace != "" {
+		return namespace
 	}
 	return defaultNamespace
 }
 
-func readInClusterNamespace() string {
-	content, err := os.ReadFile(inClusterNamespaceFile)
-	if err != nil {
-		return ""
-	}
-	return strings.TrimSpace(string(content))
-}
-
 // resolveImagePullPolicy maps the validated provider image_pull_policy to a corev1.PullPolicy.
 // Empty string defaults to PullIfNotPresent.
 func resolveImagePullPolicy(policy string) corev1.PullPolicy {
@@ -246,12 +246,14 @@ func (r *LocalRuntime) runBenchmark(
 	setSysProcAttr(cmd)
 
 	// Set environment variables
-	cmd.Env = append(os.Environ(),
-		fmt.Sprintf("EVALHUB_JOB_SPEC_PATH=%s", absJobSpecPath),
-	)
+	// Size the slice for the job and provider entries up front so appending them never regrows it
+	environ := os.Environ()
+	cmd.Env = make([]string, 0, len(environ)+1+len(provider.Runtime.Local.Env))
+	cmd.Env = append(cmd.Env, environ...)
+	cmd.Env = append(cmd.Env, "EVALHUB_JOB_SPEC_PATH="+absJobSpecPath)
 	for _, envVar := range provider.Runtime.Local.Env {
 		if envVar.Name != "" {
-			cmd.Env = append(cmd.Env, fmt.Sprintf("%s=%s", envVar.Name, envVar.Value))
+			cmd.Env = append(cmd.Env, envVar.Name+"="+envVar.Value)
 		}
 	}
 
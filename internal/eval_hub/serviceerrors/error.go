@@ -34,7 +34,12 @@ func NewServiceError(messageCode *messages.MessageCode, messageParams ...any) *S
 	}
 }
 
+// WithRollback returns a copy of the error that requests a rollback. ServiceError is
+// immutable, so an error that already requests a rollback is returned as-is.
 func (e *ServiceError) WithRollback() *ServiceError {
+	if e.rollback {
+		return e
+	}
 	return &ServiceError{
 		messageCode:   e.messageCode,
 		messageParams: e.messageParams,
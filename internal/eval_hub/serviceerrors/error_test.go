@@ -34,6 +34,16 @@ func TestWithRollback_Method(t *testing.T) {
 	}
 }
 
+func TestWithRollback_Method_AlreadyRollback(t *testing.T) {
+	err := NewServiceError(messages.InternalServerError, "Error", "test").WithRollback()
+	if wrapped := err.WithRollback(); wrapped != err {
+		t.Error("WithRollback() should reuse an error that already requests rollback")
+	}
+	if wrapped := WithRollback(err); wrapped != err {
+		t.Error("WithRollback should reuse a ServiceError that already requests rollback")
+	}
+}
+
 func TestWithRollback_Func_ServiceError(t *testing.T) {
 	err := NewServiceError(messages.InternalServerError, "Error", "test")
 	wrapped := WithRollback(err)
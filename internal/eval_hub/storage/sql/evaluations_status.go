@@ -3,6 +3,7 @@ package sql
 import (
 	"database/sql"
 	"encoding/json"
+	"strings"
 
 	"github.com/eval-hub/eval-hub/internal/eval_hub/constants"
 	"github.com/eval-hub/eval-hub/internal/eval_hub/handlers"
@@ -156,15 +157,29 @@ func (s *sqlStorage) getOverallJobStatus(txn *sql.Tx, job *api.EvaluationJobReso
 		return job.Status.State, job.Status.Message, nil
 	}
 
-	// group all benchmarks by state
-	benchmarkStates := make(map[api.State]int)
-	failureMessage := ""
+	// count the benchmarks in each state that contributes to the overall state
+	var completed, failed, running, cancelled int
+	var failures strings.Builder
 	for _, benchmark := range job.Status.Benchmarks {
-		benchmarkStates[benchmark.Status]++
-		if benchmark.Status == api.StateFailed && benchmark.ErrorMessage != nil {
-			failureMessage += "Benchmark " + benchmark.ID + " failed with message: " + benchmark.ErrorMessage.Message + "\n"
+		switch benchmark.Status {
+		case api.StateCompleted:
+			completed++
+		case api.StateFailed:
+			failed++
+			if benchmark.ErrorMessage != nil {
+				failures.WriteString("Benchmark ")
+				failures.WriteString(benchmark.ID)
+				failures.WriteString(" failed with message: ")
+				failures.WriteString(benchmark.ErrorMessage.Message)
+				failures.WriteString("\n")
+			}
+		case api.StateRunning:
+			running++
+		case api.StateCancelled:
+			cancelled++
 		}
 	}
+	failureMessage := failures.String()
 
 	// determine the overall job status (use resolved benchmark count for collection-only jobs)
 	var collection *api.CollectionResource
@@ -187,7 +202,6 @@ func (s *sqlStorage) getOverallJobStatus(txn *sql.Tx, job *api.EvaluationJobReso
 		}, api.MessageOriginServer), err
 	}
 	total = len(benchmarks)
-	completed, failed, running, cancelled := benchmarkStates[api.StateCompleted], benchmarkStates[api.StateFailed], benchmarkStates[api.StateRunning], benchmarkStates[api.StateCancelled]
 
 	var overallState api.OverallState
 	var stateMessage string
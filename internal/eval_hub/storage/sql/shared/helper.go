@@ -30,25 +30,24 @@ func getString(value any) string {
 // Supports "," for AND (all must match) and "|" for OR (any must match) in any value.
 func GetValues(key string, values any) ([]any, string) {
 	s := getString(values)
-	if strings.Contains(s, ",") {
-		parts := strings.Split(s, ",")
-		results := make([]any, 0, len(parts))
-		for _, p := range parts {
-			results = append(results, strings.TrimSpace(p))
-		}
-		return results, "AND"
+	if n := strings.Count(s, ","); n > 0 {
+		return splitValues(s, ",", n+1), "AND"
 	}
-	if strings.Contains(s, "|") {
-		parts := strings.Split(s, "|")
-		results := make([]any, 0, len(parts))
-		for _, p := range parts {
-			results = append(results, strings.TrimSpace(p))
-		}
-		return results, "OR"
+	if n := strings.Count(s, "|"); n > 0 {
+		return splitValues(s, "|", n+1), "OR"
 	}
 	return []any{values}, "AND"
 }
 
+// splitValues splits s on sep into n trimmed values without building an intermediate []string.
+func splitValues(s string, sep string, n int) []any {
+	results := make([]any, 0, n)
+	for p := range strings.SplitSeq(s, sep) {
+		results = append(results, strings.TrimSpace(p))
+	}
+	return results
+}
+
 // CreateFilterStatement builds a WHERE clause and args from the filter.
 // It validates each key against the table's allowlist, sorts keys deterministically,
 // and returns both the clause and args in matching order. Returns an error if any
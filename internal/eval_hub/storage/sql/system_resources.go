@@ -2,6 +2,7 @@ package sql
 
 import (
 	"database/sql"
+	"maps"
 	"slices"
 	"strings"
 	"time"
@@ -17,6 +18,9 @@ import (
 func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.CollectionResource, systemProviders map[string]api.ProviderResource) error {
 	s.logger.Info("Loading system resources")
 
+	// all resources created by a single load share the same timestamp
+	now := time.Now()
+
 	return s.withTransaction("load-system-resources", "system", func(txn *sql.Tx) error {
 		// we take the simplest approach here:
 		// 1. delete all existing system resources
@@ -24,7 +28,6 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 		// Both steps always run so that orphaned records are removed when
 		// config files are deleted (empty maps mean "no system resources").
 		{
-			var deletedCollections []string
 			var updatedCollections []string
 			var addedCollections []string
 			existingCollections := make(map[string]api.CollectionResource)
@@ -48,7 +51,6 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 						if err != nil {
 							return serviceerrors.WithRollback(err)
 						}
-						deletedCollections = append(deletedCollections, collection.Resource.ID)
 						existingCollections[collection.Resource.ID] = collection
 					}
 				}
@@ -67,7 +69,7 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 					collection.Resource.UpdatedAt = existingCollection.Resource.UpdatedAt
 				}
 				if collection.Resource.CreatedAt.IsZero() {
-					collection.Resource.CreatedAt = time.Now()
+					collection.Resource.CreatedAt = now
 				}
 				if collection.Resource.UpdatedAt.IsZero() {
 					collection.Resource.UpdatedAt = collection.Resource.CreatedAt
@@ -76,19 +78,18 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 				if err != nil {
 					return serviceerrors.WithRollback(err)
 				}
-				if slices.Contains(deletedCollections, collection.Resource.ID) {
+				if _, ok := existingCollections[collection.Resource.ID]; ok {
 					updatedCollections = append(updatedCollections, collection.Resource.ID)
-					deletedCollections = slices.DeleteFunc(deletedCollections, func(id string) bool {
-						return id == collection.Resource.ID
-					})
+					// whatever is left in existingCollections afterwards was deleted
+					delete(existingCollections, collection.Resource.ID)
 				} else {
 					addedCollections = append(addedCollections, collection.Resource.ID)
 				}
 			}
+			deletedCollections := slices.Sorted(maps.Keys(existingCollections))
 			s.logger.Info("Loaded system collections", "added", strings.Join(addedCollections, ","), "updated", strings.Join(updatedCollections, ","), "deleted", strings.Join(deletedCollections, ","))
 		}
 		{
-			var deletedProviders []string
 			var updatedProviders []string
 			var addedProviders []string
 			existingProviders := make(map[string]api.ProviderResource)
@@ -112,7 +113,6 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 						if err != nil {
 							return serviceerrors.WithRollback(err)
 						}
-						deletedProviders = append(deletedProviders, provider.Resource.ID)
 						existingProviders[provider.Resource.ID] = provider
 					}
 				}
@@ -131,7 +131,7 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 					provider.Resource.UpdatedAt = existingProvider.Resource.UpdatedAt
 				}
 				if provider.Resource.CreatedAt.IsZero() {
-					provider.Resource.CreatedAt = time.Now()
+					provider.Resource.CreatedAt = now
 				}
 				if provider.Resource.UpdatedAt.IsZero() {
 					provider.Resource.UpdatedAt = provider.Resource.CreatedAt
@@ -140,15 +140,15 @@ func (s *sqlStorage) LoadSystemResources(systemCollections map[string]api.Collec
 				if err != nil {
 					return serviceerrors.WithRollback(err)
 				}
-				if slices.Contains(deletedProviders, provider.Resource.ID) {
+				if _, ok := existingProviders[provider.Resource.ID]; ok {
 					updatedProviders = append(updatedProviders, provider.Resource.ID)
-					deletedProviders = slices.DeleteFunc(deletedProviders, func(id string) bool {
-						return id == provider.Resource.ID
-					})
+					// whatever is left in existingProviders afterwards was deleted
+					delete(existingProviders, provider.Resource.ID)
 				} else {
 					addedProviders = append(addedProviders, provider.Resource.ID)
 				}
 			}
+			deletedProviders := slices.Sorted(maps.Keys(existingProviders))
 			s.logger.Info("Loaded system providers", "added", strings.Join(addedProviders, ","), "updated", strings.Join(updatedProviders, ","), "deleted", strings.Join(deletedProviders, ","))
 		}
 		s.logger.Info("Loaded system resources")
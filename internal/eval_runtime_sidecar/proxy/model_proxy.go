@@ -177,10 +177,8 @@ func (t *modelRoundTripper) RoundTrip(req *http.Request) (*http.Response, error)
 
 // isModelRefToken reports whether authHeader is a Bearer ref token.
 func isModelRefToken(authHeader string) bool {
-	if !strings.HasPrefix(authHeader, "Bearer ") {
-		return false
-	}
-	return strings.HasSuffix(strings.TrimPrefix(authHeader, "Bearer "), modelRefSuffix)
+	token, ok := strings.CutPrefix(authHeader, "Bearer ")
+	return ok && strings.HasSuffix(token, modelRefSuffix)
 }
 
 // isBearerEmpty reports whether authHeader carries no usable token.
@@ -192,8 +190,8 @@ func isBearerEmpty(authHeader string) bool {
 	if authHeader == "" || authHeader == "Bearer" {
 		return true
 	}
-	if strings.HasPrefix(authHeader, "Bearer ") {
-		return strings.TrimSpace(strings.TrimPrefix(authHeader, "Bearer ")) == ""
+	if token, ok := strings.CutPrefix(authHeader, "Bearer "); ok {
+		return strings.TrimSpace(token) == ""
 	}
 	return false
 }
@@ -307,13 +305,11 @@ func resolveModelCredential(logger *slog.Logger, authHeader string, secretCache
 // suffix (_api-key or _sa_token) and looking up <prefix>_url in the cache.
 // Falls back to defaultTarget when no URL entry exists or the entry is invalid.
 func resolveUpstreamURL(logger *slog.Logger, key string, secretCache map[string]string, defaultTarget *url.URL) *url.URL {
-	var prefix string
-	switch {
-	case strings.HasSuffix(key, modelAPIKeySuffix):
-		prefix = strings.TrimSuffix(key, modelAPIKeySuffix)
-	case strings.HasSuffix(key, modelSATokenSuffix):
-		prefix = strings.TrimSuffix(key, modelSATokenSuffix)
-	default:
+	prefix, ok := strings.CutSuffix(key, modelAPIKeySuffix)
+	if !ok {
+		prefix, ok = strings.CutSuffix(key, modelSATokenSuffix)
+	}
+	if !ok {
 		return defaultTarget
 	}
 
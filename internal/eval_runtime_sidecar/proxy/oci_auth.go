@@ -200,7 +200,7 @@ func canonicalRegistryHost(s string) string {
 // and returns the realm URL with query (service and scope as query params).
 func parseBearerRealm(header string) (string, error) {
 	header = strings.TrimSpace(header)
-	if !strings.HasPrefix(strings.ToLower(header), "bearer ") {
+	if len(header) < 7 || !strings.EqualFold(header[:7], "bearer ") {
 		return "", fmt.Errorf("not a Bearer challenge")
 	}
 	header = header[7:]
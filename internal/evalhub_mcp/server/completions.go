@@ -23,6 +23,8 @@ var statusValues = []string{
 	string(api.OverallStatePartiallyFailed),
 }
 
+var loweredStatusValues = lowerAll(statusValues)
+
 type completionCache struct {
 	mu      sync.Mutex
 	entries map[string]*cacheEntry
@@ -32,6 +34,7 @@ type completionCache struct {
 
 type cacheEntry struct {
 	values    []string
+	lowered   []string // lower-cased values, computed once when the entry is stored
 	expiresAt time.Time
 }
 
@@ -43,23 +46,26 @@ func newCompletionCache(ttl time.Duration) *completionCache {
 	}
 }
 
-func (c *completionCache) get(key string) ([]string, bool) {
+func (c *completionCache) lookup(key string) (*cacheEntry, bool) {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 	e, ok := c.entries[key]
 	if !ok || c.now().After(e.expiresAt) {
 		return nil, false
 	}
-	return e.values, true
+	return e, true
 }
 
-func (c *completionCache) set(key string, values []string) {
+func (c *completionCache) set(key string, values []string) *cacheEntry {
+	e := &cacheEntry{
+		values:  values,
+		lowered: lowerAll(values),
+	}
 	c.mu.Lock()
 	defer c.mu.Unlock()
-	c.entries[key] = &cacheEntry{
-		values:    values,
-		expiresAt: c.now().Add(c.ttl),
-	}
+	e.expiresAt = c.now().Add(c.ttl)
+	c.entries[key] = e
+	return e
 }
 
 type completionProvider struct {
@@ -87,8 +93,8 @@ func (cp *completionProvider) handle(ctx context.Context, req *mcp.CompleteReque
 	argName := req.Params.Argument.Name
 	prefix := req.Params.Argument.Value
 
-	values := cp.resolveValues(ctx, uri, argName)
-	filtered := filterByPrefix(values, prefix)
+	values, lowered := cp.resolveValues(ctx, uri, argName)
+	filtered := filterByPrefix(values, lowered, prefix)
 
 	return &mcp.CompleteResult{
 		Completion: mcp.CompletionResultDetails{
@@ -99,7 +105,9 @@ func (cp *completionProvider) handle(ctx context.Context, req *mcp.CompleteReque
 	}, nil
 }
 
-func (cp *completionProvider) resolveValues(ctx context.Context, uri, argName string) []string {
+// resolveValues returns the completion values for the argument together with their
+// lower-cased form used for case-insensitive prefix matching.
+func (cp *completionProvider) resolveValues(ctx context.Context, uri, argName string) ([]string, []string) {
 	switch {
 	case matchesTemplate(uri, "evalhub://providers/{id}") && argName == "id":
 		return cp.cachedFetch("providers", func() []string { return cp.fetchProviderIDs(ctx) })
@@ -110,11 +118,11 @@ func (cp *completionProvider) resolveValues(ctx context.Context, uri, argName st
 	case matchesTemplate(uri, "evalhub://jobs/{id}") && argName == "id":
 		return cp.cachedFetch("jobs", func() []string { return cp.fetchJobIDs(ctx) })
 	case matchesTemplate(uri, "evalhub://jobs{?status}") && argName == "status":
-		return statusValues
+		return statusValues, loweredStatusValues
 	case matchesTemplate(uri, "evalhub://benchmarks{?label*}") && argName == "label":
 		return cp.cachedFetch("labels", func() []string { return cp.fetchLabels(ctx) })
 	default:
-		return nil
+		return nil, nil
 	}
 }
 
@@ -122,15 +130,16 @@ func matchesTemplate(uri, template string) bool {
 	return uri == template
 }
 
-func (cp *completionProvider) cachedFetch(key string, fetch func() []string) []string {
-	if values, ok := cp.cache.get(key); ok {
-		return values
+func (cp *completionProvider) cachedFetch(key string, fetch func() []string) ([]string, []string) {
+	if e, ok := cp.cache.lookup(key); ok {
+		return e.values, e.lowered
 	}
 	values := fetch()
-	if values != nil {
-		cp.cache.set(key, values)
+	if values == nil {
+		return nil, nil
 	}
-	return values
+	e := cp.cache.set(key, values)
+	return e.values, e.lowered
 }
 
 func (cp *completionProvider) fetchProviderIDs(ctx context.Context) []string {
@@ -209,20 +218,33 @@ func (cp *completionProvider) fetchLabels(ctx context.Context) []string {
 	return labels
 }
 
-func filterByPrefix(values []string, prefix string) []string {
+// filterByPrefix returns the values that start with prefix, ignoring case.
+// lowered[i] must be strings.ToLower(values[i]).
+func filterByPrefix(values []string, lowered []string, prefix string) []string {
 	if prefix == "" {
 		return values
 	}
 	lower := strings.ToLower(prefix)
 	var result []string
-	for _, v := range values {
-		if strings.HasPrefix(strings.ToLower(v), lower) {
-			result = append(result, v)
+	for i, v := range lowered {
+		if strings.HasPrefix(v, lower) {
+			result = append(result, values[i])
 		}
 	}
 	return result
 }
 
+func lowerAll(values []string) []string {
+	if values == nil {
+		return nil
+	}
+	lowered := make([]string, len(values))
+	for i, v := range values {
+		lowered[i] = strings.ToLower(v)
+	}
+	return lowered
+}
+
 func emptyResult() *mcp.CompleteResult {
 	return &mcp.CompleteResult{
 		Completion: mcp.CompletionResultDetails{
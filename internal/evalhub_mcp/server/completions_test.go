@@ -562,7 +562,7 @@ func TestFilterByPrefix(t *testing.T) {
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			t.Parallel()
-			got := filterByPrefix(tt.values, tt.prefix)
+			got := filterByPrefix(tt.values, lowerAll(tt.values), tt.prefix)
 			if len(got) != tt.want {
 				t.Errorf("filterByPrefix(%v, %q) = %d results, want %d", tt.values, tt.prefix, len(got), tt.want)
 			}
@@ -572,25 +572,25 @@ func TestFilterByPrefix(t *testing.T) {
 
 // --- completionCache unit tests ---
 
-func TestCompletionCacheGetMiss(t *testing.T) {
+func TestCompletionCacheLookupMiss(t *testing.T) {
 	t.Parallel()
 	c := newCompletionCache(time.Minute)
-	_, ok := c.get("nonexistent")
+	_, ok := c.lookup("nonexistent")
 	if ok {
 		t.Error("expected cache miss for nonexistent key")
 	}
 }
 
-func TestCompletionCacheGetHit(t *testing.T) {
+func TestCompletionCacheLookupHit(t *testing.T) {
 	t.Parallel()
 	c := newCompletionCache(time.Minute)
 	c.set("key", []string{"a", "b"})
-	vals, ok := c.get("key")
+	e, ok := c.lookup("key")
 	if !ok {
 		t.Fatal("expected cache hit")
 	}
-	if len(vals) != 2 {
-		t.Errorf("expected 2 values, got %d", len(vals))
+	if len(e.values) != 2 {
+		t.Errorf("expected 2 values, got %d", len(e.values))
 	}
 }
 
@@ -601,18 +601,35 @@ func TestCompletionCacheExpired(t *testing.T) {
 	c.now = func() time.Time { return now }
 
 	c.set("key", []string{"a"})
-	_, ok := c.get("key")
+	_, ok := c.lookup("key")
 	if !ok {
 		t.Fatal("expected cache hit before expiry")
 	}
 
 	c.now = func() time.Time { return now.Add(2 * time.Second) }
-	_, ok = c.get("key")
+	_, ok = c.lookup("key")
 	if ok {
 		t.Error("expected cache miss after expiry")
 	}
 }
 
+func TestCompletionCacheStoresLoweredValues(t *testing.T) {
+	t.Parallel()
+	c := newCompletionCache(time.Minute)
+	c.set("key", []string{"FooBar", "baz"})
+	e, ok := c.lookup("key")
+	if !ok {
+		t.Fatal("expected cache hit")
+	}
+	if len(e.lowered) != 2 || e.lowered[0] != "foobar" || e.lowered[1] != "baz" {
+		t.Errorf("expected lowered values [foobar baz], got %v", e.lowered)
+	}
+	got := filterByPrefix(e.values, e.lowered, "FOO")
+	if len(got) != 1 || got[0] != "FooBar" {
+		t.Errorf("expected original-case match [FooBar], got %v", got)
+	}
+}
+
 // --- matchesTemplate ---
 
 func TestMatchesTemplate(t *testing.T) {
@@ -3,4 +3,6 @@ package platform
 var (
 	ReadFile       = readFile
 	IsFIPSFromPath = isFIPSFromPath
+
+	InClusterNamespaceFromPath = inClusterNamespaceFromPath
 )
@@ -3,8 +3,11 @@ package platform
 import (
 	"os"
 	"strings"
+	"sync"
 )
 
+const inClusterNamespaceFile = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+
 func readFile(path string) string {
 	content, err := os.ReadFile(path) // #nosec G304 -- platform metadata path from Kubernetes downward API
 	if err != nil {
@@ -22,3 +25,22 @@ var fipsEnabled = isFIPSFromPath("/proc/sys/crypto/fips_enabled")
 func IsFIPS() bool {
 	return fipsEnabled
 }
+
+func inClusterNamespaceFromPath(path string) string {
+	return strings.TrimSpace(readFile(path))
+}
+
+var (
+	inClusterNamespaceOnce sync.Once
+	inClusterNamespace     string
+)
+
+// InClusterNamespace returns the service account namespace of the pod, or an empty string
+// when not running in-cluster. The mounted file does not change for the pod's lifetime so
+// it is only read once.
+func InClusterNamespace() string {
+	inClusterNamespaceOnce.Do(func() {
+		inClusterNamespace = inClusterNamespaceFromPath(inClusterNamespaceFile)
+	})
+	return inClusterNamespace
+}
@@ -81,3 +81,26 @@ func TestIsFIPSFromPath(t *testing.T) {
 		}
 	})
 }
+
+func TestInClusterNamespaceFromPath(t *testing.T) {
+	t.Parallel()
+
+	t.Run("returns trimmed namespace", func(t *testing.T) {
+		t.Parallel()
+		p := filepath.Join(t.TempDir(), "namespace")
+		if err := os.WriteFile(p, []byte("eval-hub\n"), 0o600); err != nil {
+			t.Fatal(err)
+		}
+		if got := platform.InClusterNamespaceFromPath(p); got != "eval-hub" {
+			t.Errorf("InClusterNamespaceFromPath(%q) = %q, want %q", p, got, "eval-hub")
+		}
+	})
+
+	t.Run("missing file returns empty", func(t *testing.T) {
+		t.Parallel()
+		p := filepath.Join(t.TempDir(), "missing")
+		if got := platform.InClusterNamespaceFromPath(p); got != "" {
+			t.Errorf("InClusterNamespaceFromPath(missing file) = %q, want empty string", got)
+		}
+	})
+}
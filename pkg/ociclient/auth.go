@@ -169,7 +169,7 @@ func validateTokenRealmURL(registry, nextURL string) error {
 // re-attaches service/scope query parameters required by the registry token endpoint
 func parseBearerRealm(header string) (string, error) {
 	header = strings.TrimSpace(header)
-	if !strings.HasPrefix(strings.ToLower(header), "bearer ") {
+	if len(header) < 7 || !strings.EqualFold(header[:7], "bearer ") {
 		return "", fmt.Errorf("not a Bearer challenge")
 	}
 	header = header[7:]